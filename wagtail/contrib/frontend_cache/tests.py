@@ -417,6 +417,10 @@ class TestBackendConfiguration(SimpleTestCase):
         self.assertEqual(backends["default"].cache_netloc, "localhost:8000")
 
 
+# URLs purged by the mock backends below. Backends are instantiated on every purge
+# call, so this can't live on the instance; being module-level, it is still local
+# to each test process when running with --parallel. Tests using the mock backends
+# must clear it in setUp.
 PURGED_URLS = set()
 
 
@@ -2,13 +2,14 @@ from io import BytesIO
 
 from django.conf import settings
 from django.contrib.auth.models import Permission
-from django.test import TestCase, override_settings
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from openpyxl.reader.excel import load_workbook
 
 from wagtail.admin.admin_url_finder import AdminURLFinder
 from wagtail.contrib.frontend_cache.tests import PURGED_URLS
 from wagtail.contrib.redirects import models
+from wagtail.contrib.redirects.views import IndexView
 from wagtail.log_actions import registry as log_registry
 from wagtail.models import Page, Site
 from wagtail.test.routablepage.models import RoutablePageTest
@@ -16,12 +17,31 @@ from wagtail.test.utils import WagtailTestUtils
 from wagtail.test.utils.template_tests import AdminTemplateTestUtils
 
 
+class RedirectAssertionsMixin:
+    def assertPermanentRedirect(self, response, expected_url):
+        # Only the redirect response itself is under test, so never follow it
+        self.assertRedirects(
+            response, expected_url, status_code=301, fetch_redirect_response=False
+        )
+
+    def assertTemporaryRedirect(self, response, expected_url):
+        self.assertRedirects(
+            response, expected_url, status_code=302, fetch_redirect_response=False
+        )
+
+
 @override_settings(
     ALLOWED_HOSTS=["testserver", "localhost", "test.example.com", "other.example.com"]
 )
-class TestRedirects(TestCase):
+class TestRedirects(RedirectAssertionsMixin, TestCase):
     fixtures = ["test.json"]
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.homepage = Page.objects.get(id=2)
+        cls.christmas_page = Page.objects.get(url_path="/home/events/christmas/")
+        cls.contact_page = Page.objects.get(url_path="/home/contact-us/")
+
     def test_path_normalisation(self):
         # Shortcut to normalise function (to keep things tidy)
         normalise_path = models.Redirect.normalise_path
@@ -31,115 +51,56 @@ class TestRedirects(TestCase):
             "/Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2"
         )
 
-        # Test against equivalent paths
-        self.assertEqual(
-            path,
-            normalise_path(  # The exact same URL
-                "/Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertEqual(
-            path,
-            normalise_path(  # Scheme, hostname and port ignored
-                "http://mywebsite.com:8000/Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertEqual(
-            path,
-            normalise_path(  # Leading slash can be omitted
-                "Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertEqual(
-            path,
-            normalise_path(  # Trailing slashes are ignored
-                "Hello/world.html/;fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertEqual(
-            path,
-            normalise_path(  # Fragments are ignored
-                "/Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2#cool"
-            ),
-        )
-        self.assertEqual(
-            path,
-            normalise_path(  # Order of query string parameters is ignored
-                "/Hello/world.html;fizz=three;buzz=five?Baz=quux2&foo=Bar"
-            ),
-        )
-        self.assertEqual(
-            path,
-            normalise_path(  # Order of parameters is ignored
-                "/Hello/world.html;buzz=five;fizz=three?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertEqual(
-            path,
-            normalise_path(  # Leading whitespace
-                "  /Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertEqual(
-            path,
-            normalise_path(  # Trailing whitespace
-                "/Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2  "
-            ),
+        equivalent_paths = (
+            # The exact same URL
+            "/Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2",
+            # Scheme, hostname and port ignored
+            "http://mywebsite.com:8000/Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2",
+            # Leading slash can be omitted
+            "Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2",
+            # Trailing slashes are ignored
+            "Hello/world.html/;fizz=three;buzz=five?foo=Bar&Baz=quux2",
+            # Fragments are ignored
+            "/Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2#cool",
+            # Order of query string parameters is ignored
+            "/Hello/world.html;fizz=three;buzz=five?Baz=quux2&foo=Bar",
+            # Order of parameters is ignored
+            "/Hello/world.html;buzz=five;fizz=three?foo=Bar&Baz=quux2",
+            # Leading whitespace
+            "  /Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2",
+            # Trailing whitespace
+            "/Hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2  ",
+        )
+        different_paths = (
+            # 'hello' is lowercase
+            "/hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2",
+            # No '.html'
+            "/Hello/world;fizz=three;buzz=five?foo=Bar&Baz=quux2",
+            # Query string parameter value has wrong case
+            "/Hello/world.html;fizz=three;buzz=five?foo=bar&Baz=Quux2",
+            # Query string parameter name has wrong case
+            "/Hello/world.html;fizz=three;buzz=five?foo=Bar&baz=quux2",
+            # Parameter value has wrong case
+            "/Hello/world.html;fizz=three;buzz=Five?foo=Bar&Baz=quux2",
+            # Parameter name has wrong case
+            "/Hello/world.html;Fizz=three;buzz=five?foo=Bar&Baz=quux2",
+            # Missing params
+            "/Hello/world.html?foo=Bar&Baz=quux2",
+            # 'WORLD' is uppercase
+            "/Hello/WORLD.html;fizz=three;buzz=five?foo=Bar&Baz=quux2",
+            # '.htm' is not the same as '.html'
+            "/Hello/world.htm;fizz=three;buzz=five?foo=Bar&Baz=quux2",
         )
 
+        # Test against equivalent paths
+        for url in equivalent_paths:
+            with self.subTest(url=url):
+                self.assertEqual(path, normalise_path(url))
+
         # Test against different paths
-        self.assertNotEqual(
-            path,
-            normalise_path(  # 'hello' is lowercase
-                "/hello/world.html;fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertNotEqual(
-            path,
-            normalise_path(  # No '.html'
-                "/Hello/world;fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertNotEqual(
-            path,
-            normalise_path(  # Query string parameter value has wrong case
-                "/Hello/world.html;fizz=three;buzz=five?foo=bar&Baz=Quux2"
-            ),
-        )
-        self.assertNotEqual(
-            path,
-            normalise_path(  # Query string parameter name has wrong case
-                "/Hello/world.html;fizz=three;buzz=five?foo=Bar&baz=quux2"
-            ),
-        )
-        self.assertNotEqual(
-            path,
-            normalise_path(  # Parameter value has wrong case
-                "/Hello/world.html;fizz=three;buzz=Five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertNotEqual(
-            path,
-            normalise_path(  # Parameter name has wrong case
-                "/Hello/world.html;Fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertNotEqual(
-            path,
-            normalise_path("/Hello/world.html?foo=Bar&Baz=quux2"),  # Missing params
-        )
-        self.assertNotEqual(
-            path,
-            normalise_path(  # 'WORLD' is uppercase
-                "/Hello/WORLD.html;fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
-        self.assertNotEqual(
-            path,
-            normalise_path(  # '.htm' is not the same as '.html'
-                "/Hello/world.htm;fizz=three;buzz=five?foo=Bar&Baz=quux2"
-            ),
-        )
+        for url in different_paths:
+            with self.subTest(url=url):
+                self.assertNotEqual(path, normalise_path(url))
 
         self.assertEqual("/", normalise_path("/"))  # '/' should stay '/'
 
@@ -188,9 +149,7 @@ class TestRedirects(TestCase):
         response = self.client.get("/redirectme/")
 
         # Check that we were redirected
-        self.assertRedirects(
-            response, "/redirectto", status_code=301, fetch_redirect_response=False
-        )
+        self.assertPermanentRedirect(response, "/redirectto")
 
     def test_temporary_redirect(self):
         # Create a redirect
@@ -203,9 +162,7 @@ class TestRedirects(TestCase):
         response = self.client.get("/redirectme/")
 
         # Check that we were redirected temporarily
-        self.assertRedirects(
-            response, "/redirectto", status_code=302, fetch_redirect_response=False
-        )
+        self.assertTemporaryRedirect(response, "/redirectto")
 
     def test_redirect_without_trailing_slash(self):
         # Create a redirect
@@ -221,9 +178,7 @@ class TestRedirects(TestCase):
         # Before Django 4.2, CommonMiddleware performed the 'add trailing slash' test
         # during the initial request processing, which took precedence over RedirectMiddleware
         # and caused a double redirect (/redirectme -> /redirectme/ -> /redirectto).
-        self.assertRedirects(
-            response, "/redirectto", status_code=301, fetch_redirect_response=False
-        )
+        self.assertPermanentRedirect(response, "/redirectto")
 
     def test_redirect_stripping_query_string(self):
         # Create a redirect which includes a query string
@@ -240,46 +195,30 @@ class TestRedirects(TestCase):
 
         # Navigate to the redirect with the query string
         r_matching_qs = self.client.get("/redirectme/?foo=Bar")
-        self.assertRedirects(
-            r_matching_qs,
-            "/with-query-string-only",
-            status_code=301,
-            fetch_redirect_response=False,
-        )
+        self.assertPermanentRedirect(r_matching_qs, "/with-query-string-only")
 
         # Navigate to the redirect with a different query string
         # This should strip out the query string and match redirect_without_query_string
         r_no_qs = self.client.get("/redirectme/?utm_source=irrelevant")
-        self.assertRedirects(
-            r_no_qs,
-            "/without-query-string",
-            status_code=301,
-            fetch_redirect_response=False,
-        )
+        self.assertPermanentRedirect(r_no_qs, "/without-query-string")
 
     def test_redirect_to_page(self):
-        christmas_page = Page.objects.get(url_path="/home/events/christmas/")
-        models.Redirect.objects.create(old_path="/xmas", redirect_page=christmas_page)
+        models.Redirect.objects.create(
+            old_path="/xmas", redirect_page=self.christmas_page
+        )
 
         response = self.client.get("/xmas/", HTTP_HOST="test.example.com")
         # Only one site defined, so redirect should return a local URL
         # (to keep things working if Site records haven't been configured correctly)
-        self.assertRedirects(
-            response,
-            "/events/christmas/",
-            status_code=301,
-            fetch_redirect_response=False,
-        )
+        self.assertPermanentRedirect(response, "/events/christmas/")
 
     def test_redirect_to_specific_page_route(self):
-        homepage = Page.objects.get(id=2)
-        routable_page = homepage.add_child(
+        routable_page = self.homepage.add_child(
             instance=RoutablePageTest(
                 title="Routable Page",
                 live=True,
             )
         )
-        contact_page = Page.objects.get(url_path="/home/contact-us/")
 
         # test redirect with a VALID route path
         models.Redirect.add_redirect(
@@ -288,11 +227,8 @@ class TestRedirects(TestCase):
             page_route_path="/render-method-test-custom-template/",
         )
         response = self.client.get("/old-path-one/", HTTP_HOST="test.example.com")
-        self.assertRedirects(
-            response,
-            "/routable-page/render-method-test-custom-template/",
-            status_code=301,
-            fetch_redirect_response=False,
+        self.assertPermanentRedirect(
+            response, "/routable-page/render-method-test-custom-template/"
         )
 
         # test redirect with an INVALID route path
@@ -303,70 +239,17 @@ class TestRedirects(TestCase):
         )
         response = self.client.get("/old-path-two/", HTTP_HOST="test.example.com")
         # we should still make it to the correct page
-        self.assertRedirects(
-            response, "/routable-page/", status_code=301, fetch_redirect_response=False
-        )
+        self.assertPermanentRedirect(response, "/routable-page/")
 
         # test redirect with route path for a non-routable page
         models.Redirect.add_redirect(
             old_path="/old-path-three",
-            redirect_to=contact_page,
+            redirect_to=self.contact_page,
             page_route_path="/route-to-nowhere/",
         )
         response = self.client.get("/old-path-three/", HTTP_HOST="test.example.com")
         # we should still make it to the correct page
-        self.assertRedirects(
-            response, "/contact-us/", status_code=301, fetch_redirect_response=False
-        )
-
-    def test_redirect_from_any_site(self):
-        contact_page = Page.objects.get(url_path="/home/contact-us/")
-        Site.objects.create(
-            hostname="other.example.com", port=80, root_page=contact_page
-        )
-
-        christmas_page = Page.objects.get(url_path="/home/events/christmas/")
-        models.Redirect.objects.create(old_path="/xmas", redirect_page=christmas_page)
-
-        # no site was specified on the redirect, so it should redirect regardless of hostname
-        response = self.client.get("/xmas/", HTTP_HOST="localhost")
-        self.assertRedirects(
-            response,
-            "http://localhost/events/christmas/",
-            status_code=301,
-            fetch_redirect_response=False,
-        )
-
-        response = self.client.get("/xmas/", HTTP_HOST="other.example.com")
-        self.assertRedirects(
-            response,
-            "http://localhost/events/christmas/",
-            status_code=301,
-            fetch_redirect_response=False,
-        )
-
-    def test_redirect_from_specific_site(self):
-        contact_page = Page.objects.get(url_path="/home/contact-us/")
-        other_site = Site.objects.create(
-            hostname="other.example.com", port=80, root_page=contact_page
-        )
-
-        christmas_page = Page.objects.get(url_path="/home/events/christmas/")
-        models.Redirect.objects.create(
-            old_path="/xmas", redirect_page=christmas_page, site=other_site
-        )
-
-        # redirect should only respond when site is other_site
-        response = self.client.get("/xmas/", HTTP_HOST="other.example.com")
-        self.assertRedirects(
-            response,
-            "http://localhost/events/christmas/",
-            status_code=301,
-            fetch_redirect_response=False,
-        )
-
-        response = self.client.get("/xmas/", HTTP_HOST="localhost")
-        self.assertEqual(response.status_code, 404)
+        self.assertPermanentRedirect(response, "/contact-us/")
 
     def test_redirect_without_page_or_link_target(self):
         models.Redirect.objects.create(old_path="/xmas/", redirect_link="")
@@ -383,142 +266,6 @@ class TestRedirects(TestCase):
         response = self.client.get("/xmas/", HTTP_HOST="localhost")
         self.assertEqual(response.status_code, 404)
 
-    def test_duplicate_redirects_when_match_is_for_generic(self):
-        contact_page = Page.objects.get(url_path="/home/contact-us/")
-        site = Site.objects.create(
-            hostname="other.example.com", port=80, root_page=contact_page
-        )
-
-        # two redirects, one for any site, one for specific
-        models.Redirect.objects.create(old_path="/xmas", redirect_link="/generic")
-        models.Redirect.objects.create(
-            site=site, old_path="/xmas", redirect_link="/site-specific"
-        )
-
-        response = self.client.get("/xmas/")
-        # the redirect which matched was /generic
-        self.assertRedirects(
-            response, "/generic", status_code=301, fetch_redirect_response=False
-        )
-
-    def test_duplicate_redirects_with_query_string_when_match_is_for_generic(self):
-        contact_page = Page.objects.get(url_path="/home/contact-us/")
-        site = Site.objects.create(
-            hostname="other.example.com", port=80, root_page=contact_page
-        )
-
-        # two redirects, one for any site, one for specific, both with query string
-        models.Redirect.objects.create(
-            old_path="/xmas?foo=Bar", redirect_link="/generic-with-query-string"
-        )
-        models.Redirect.objects.create(
-            site=site,
-            old_path="/xmas?foo=Bar",
-            redirect_link="/site-specific-with-query-string",
-        )
-
-        # and two redirects, one for any site, one for specific, without query strings
-        models.Redirect.objects.create(old_path="/xmas", redirect_link="/generic")
-        models.Redirect.objects.create(
-            site=site, old_path="/xmas", redirect_link="/site-specific"
-        )
-
-        response = self.client.get("/xmas/?foo=Bar")
-        # the redirect which matched was /generic-with-query-string
-        self.assertRedirects(
-            response,
-            "/generic-with-query-string",
-            status_code=301,
-            fetch_redirect_response=False,
-        )
-
-        # now use a non-matching query string
-        response = self.client.get("/xmas/?foo=Baz")
-        # the redirect which matched was /generic
-        self.assertRedirects(
-            response, "/generic", status_code=301, fetch_redirect_response=False
-        )
-
-    def test_duplicate_redirects_when_match_is_for_specific(self):
-        contact_page = Page.objects.get(url_path="/home/contact-us/")
-        site = Site.objects.create(
-            hostname="other.example.com", port=80, root_page=contact_page
-        )
-
-        # two redirects, one for any site, one for specific
-        models.Redirect.objects.create(old_path="/xmas", redirect_link="/generic")
-        models.Redirect.objects.create(
-            site=site, old_path="/xmas", redirect_link="/site-specific"
-        )
-
-        response = self.client.get("/xmas/", HTTP_HOST="other.example.com")
-        # the redirect which matched was /site-specific
-        self.assertRedirects(
-            response, "/site-specific", status_code=301, fetch_redirect_response=False
-        )
-
-    def test_duplicate_redirects_with_query_string_when_match_is_for_specific_with_qs(
-        self,
-    ):
-        contact_page = Page.objects.get(url_path="/home/contact-us/")
-        site = Site.objects.create(
-            hostname="other.example.com", port=80, root_page=contact_page
-        )
-
-        # two redirects, one for any site, one for specific, both with query string
-        models.Redirect.objects.create(
-            old_path="/xmas?foo=Bar", redirect_link="/generic-with-query-string"
-        )
-        models.Redirect.objects.create(
-            site=site,
-            old_path="/xmas?foo=Bar",
-            redirect_link="/site-specific-with-query-string",
-        )
-
-        # and two redirects, one for any site, one for specific, without query strings
-        models.Redirect.objects.create(old_path="/xmas", redirect_link="/generic")
-        models.Redirect.objects.create(
-            site=site, old_path="/xmas", redirect_link="/site-specific"
-        )
-
-        response = self.client.get("/xmas/?foo=Bar", HTTP_HOST="other.example.com")
-        # the redirect which matched was /site-specific-with-query-string
-        self.assertRedirects(
-            response,
-            "/site-specific-with-query-string",
-            status_code=301,
-            fetch_redirect_response=False,
-        )
-
-        # now use a non-matching query string
-        response = self.client.get("/xmas/?foo=Baz", HTTP_HOST="other.example.com")
-        # the redirect which matched was /site-specific
-        self.assertRedirects(
-            response, "/site-specific", status_code=301, fetch_redirect_response=False
-        )
-
-    def test_duplicate_page_redirects_when_match_is_for_specific(self):
-        contact_page = Page.objects.get(url_path="/home/contact-us/")
-        site = Site.objects.create(
-            hostname="other.example.com", port=80, root_page=contact_page
-        )
-        christmas_page = Page.objects.get(url_path="/home/events/christmas/")
-
-        # two redirects, one for any site, one for specific
-        models.Redirect.objects.create(old_path="/xmas", redirect_page=contact_page)
-        models.Redirect.objects.create(
-            site=site, old_path="/xmas", redirect_page=christmas_page
-        )
-
-        # request for specific site gets the christmas_page redirect, not accessible from other.example.com
-        response = self.client.get("/xmas/", HTTP_HOST="other.example.com")
-        self.assertRedirects(
-            response,
-            "http://localhost/events/christmas/",
-            status_code=301,
-            fetch_redirect_response=False,
-        )
-
     def test_redirect_with_unicode_in_url(self):
         redirect = models.Redirect(
             old_path="/tésting-ünicode", redirect_link="/redirectto"
@@ -528,9 +275,7 @@ class TestRedirects(TestCase):
         # Navigate to it
         response = self.client.get("/tésting-ünicode/")
 
-        self.assertRedirects(
-            response, "/redirectto", status_code=301, fetch_redirect_response=False
-        )
+        self.assertPermanentRedirect(response, "/redirectto")
 
     def test_redirect_with_encoded_url(self):
         redirect = models.Redirect(
@@ -541,22 +286,18 @@ class TestRedirects(TestCase):
         # Navigate to it
         response = self.client.get("/t%C3%A9sting-%C3%BCnicode/")
 
-        self.assertRedirects(
-            response, "/redirectto", status_code=301, fetch_redirect_response=False
-        )
+        self.assertPermanentRedirect(response, "/redirectto")
 
     def test_reject_null_characters(self):
-        response = self.client.get("/test%00test/")
-        self.assertEqual(response.status_code, 404)
-
-        response = self.client.get("/test\0test/")
-        self.assertEqual(response.status_code, 404)
-
-        response = self.client.get("/test/?foo=%00bar")
-        self.assertEqual(response.status_code, 404)
-
-        response = self.client.get("/test/?foo=\0bar")
-        self.assertEqual(response.status_code, 404)
+        for url in (
+            "/test%00test/",
+            "/test\0test/",
+            "/test/?foo=%00bar",
+            "/test/?foo=\0bar",
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 404)
 
     def test_add_redirect_with_url(self):
         add_redirect = models.Redirect.add_redirect
@@ -582,7 +323,7 @@ class TestRedirects(TestCase):
         add_redirect = models.Redirect.add_redirect
 
         old_path = "/old-path"
-        redirect_to = Page.objects.get(url_path="/home/events/christmas/")
+        redirect_to = self.christmas_page
 
         # Create a redirect
         redirect = add_redirect(old_path=old_path, redirect_to=redirect_to)
@@ -597,6 +338,166 @@ class TestRedirects(TestCase):
         self.assertIs(redirect.is_permanent, True)
 
 
+@override_settings(
+    ALLOWED_HOSTS=["testserver", "localhost", "test.example.com", "other.example.com"]
+)
+class TestRedirectsWithMultipleSites(RedirectAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        homepage = Site.objects.get(is_default_site=True).root_page
+        events_page = homepage.add_child(
+            instance=Page(title="Events", slug="events", live=True)
+        )
+        cls.christmas_page = events_page.add_child(
+            instance=Page(title="Christmas", slug="christmas", live=True)
+        )
+        cls.contact_page = homepage.add_child(
+            instance=Page(title="Contact us", slug="contact-us", live=True)
+        )
+        cls.other_site = Site.objects.create(
+            hostname="other.example.com", port=80, root_page=cls.contact_page
+        )
+
+    def test_redirect_from_any_site(self):
+        models.Redirect.objects.create(
+            old_path="/xmas", redirect_page=self.christmas_page
+        )
+
+        # no site was specified on the redirect, so it should redirect regardless of hostname
+        response = self.client.get("/xmas/", HTTP_HOST="localhost")
+        self.assertPermanentRedirect(response, "http://localhost/events/christmas/")
+
+        response = self.client.get("/xmas/", HTTP_HOST="other.example.com")
+        self.assertPermanentRedirect(response, "http://localhost/events/christmas/")
+
+    def test_redirect_from_specific_site(self):
+        models.Redirect.objects.create(
+            old_path="/xmas", redirect_page=self.christmas_page, site=self.other_site
+        )
+
+        # redirect should only respond when site is other_site
+        response = self.client.get("/xmas/", HTTP_HOST="other.example.com")
+        self.assertPermanentRedirect(response, "http://localhost/events/christmas/")
+
+        response = self.client.get("/xmas/", HTTP_HOST="localhost")
+        self.assertEqual(response.status_code, 404)
+
+    def test_duplicate_redirects_when_match_is_for_generic(self):
+        # two redirects, one for any site, one for specific
+        models.Redirect.objects.bulk_create(
+            [
+                models.Redirect(old_path="/xmas", redirect_link="/generic"),
+                models.Redirect(
+                    site=self.other_site,
+                    old_path="/xmas",
+                    redirect_link="/site-specific",
+                ),
+            ]
+        )
+
+        response = self.client.get("/xmas/")
+        # the redirect which matched was /generic
+        self.assertPermanentRedirect(response, "/generic")
+
+    def test_duplicate_redirects_with_query_string_when_match_is_for_generic(self):
+        models.Redirect.objects.bulk_create(
+            [
+                # two redirects, one for any site, one for specific, both with query string
+                models.Redirect(
+                    old_path="/xmas?foo=Bar", redirect_link="/generic-with-query-string"
+                ),
+                models.Redirect(
+                    site=self.other_site,
+                    old_path="/xmas?foo=Bar",
+                    redirect_link="/site-specific-with-query-string",
+                ),
+                # and two redirects, one for any site, one for specific, without query strings
+                models.Redirect(old_path="/xmas", redirect_link="/generic"),
+                models.Redirect(
+                    site=self.other_site,
+                    old_path="/xmas",
+                    redirect_link="/site-specific",
+                ),
+            ]
+        )
+
+        response = self.client.get("/xmas/?foo=Bar")
+        # the redirect which matched was /generic-with-query-string
+        self.assertPermanentRedirect(response, "/generic-with-query-string")
+
+        # now use a non-matching query string
+        response = self.client.get("/xmas/?foo=Baz")
+        # the redirect which matched was /generic
+        self.assertPermanentRedirect(response, "/generic")
+
+    def test_duplicate_redirects_when_match_is_for_specific(self):
+        # two redirects, one for any site, one for specific
+        models.Redirect.objects.bulk_create(
+            [
+                models.Redirect(old_path="/xmas", redirect_link="/generic"),
+                models.Redirect(
+                    site=self.other_site,
+                    old_path="/xmas",
+                    redirect_link="/site-specific",
+                ),
+            ]
+        )
+
+        response = self.client.get("/xmas/", HTTP_HOST="other.example.com")
+        # the redirect which matched was /site-specific
+        self.assertPermanentRedirect(response, "/site-specific")
+
+    def test_duplicate_redirects_with_query_string_when_match_is_for_specific_with_qs(
+        self,
+    ):
+        models.Redirect.objects.bulk_create(
+            [
+                # two redirects, one for any site, one for specific, both with query string
+                models.Redirect(
+                    old_path="/xmas?foo=Bar", redirect_link="/generic-with-query-string"
+                ),
+                models.Redirect(
+                    site=self.other_site,
+                    old_path="/xmas?foo=Bar",
+                    redirect_link="/site-specific-with-query-string",
+                ),
+                # and two redirects, one for any site, one for specific, without query strings
+                models.Redirect(old_path="/xmas", redirect_link="/generic"),
+                models.Redirect(
+                    site=self.other_site,
+                    old_path="/xmas",
+                    redirect_link="/site-specific",
+                ),
+            ]
+        )
+
+        response = self.client.get("/xmas/?foo=Bar", HTTP_HOST="other.example.com")
+        # the redirect which matched was /site-specific-with-query-string
+        self.assertPermanentRedirect(response, "/site-specific-with-query-string")
+
+        # now use a non-matching query string
+        response = self.client.get("/xmas/?foo=Baz", HTTP_HOST="other.example.com")
+        # the redirect which matched was /site-specific
+        self.assertPermanentRedirect(response, "/site-specific")
+
+    def test_duplicate_page_redirects_when_match_is_for_specific(self):
+        # two redirects, one for any site, one for specific
+        models.Redirect.objects.bulk_create(
+            [
+                models.Redirect(old_path="/xmas", redirect_page=self.contact_page),
+                models.Redirect(
+                    site=self.other_site,
+                    old_path="/xmas",
+                    redirect_page=self.christmas_page,
+                ),
+            ]
+        )
+
+        # request for specific site gets the christmas_page redirect, not accessible from other.example.com
+        response = self.client.get("/xmas/", HTTP_HOST="other.example.com")
+        self.assertPermanentRedirect(response, "http://localhost/events/christmas/")
+
+
 @override_settings(
     CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 )
@@ -604,12 +505,21 @@ class TestRedirectsIndexView(AdminTemplateTestUtils, WagtailTestUtils, TestCase)
     @classmethod
     def setUpTestData(cls):
         cls.site = Site.objects.first()
+        cls.user = cls.create_test_user()
+        cls.index_url = reverse("wagtailredirects:index")
 
     def setUp(self):
-        self.login()
+        self.client.force_login(self.user)
 
-    def get(self, params={}):
-        return self.client.get(reverse("wagtailredirects:index"), params)
+    def get(self, params=None):
+        return self.client.get(self.index_url, params)
+
+    def get_export(self, export_format):
+        # Call the view directly, as the export response doesn't depend on any
+        # middleware; test_num_queries_in_export covers the full request cycle
+        request = RequestFactory().get(self.index_url, {"export": export_format})
+        request.user = self.user
+        return IndexView.as_view()(request)
 
     def test_simple(self):
         response = self.get()
@@ -622,34 +532,42 @@ class TestRedirectsIndexView(AdminTemplateTestUtils, WagtailTestUtils, TestCase)
         self.assertContains(response, "No redirects have been created")
 
     def test_search(self):
-        models.Redirect.objects.create(
-            old_path="/aaargh", redirect_link="http://torchbox.com/"
-        )
-        models.Redirect.objects.create(
-            old_path="/torchbox", redirect_link="http://aaargh.com/"
-        )
-        models.Redirect.objects.create(
-            old_path="/unrelated", redirect_link="http://unrelated.com/"
+        models.Redirect.objects.bulk_create(
+            [
+                models.Redirect(
+                    old_path="/aaargh", redirect_link="http://torchbox.com/"
+                ),
+                models.Redirect(
+                    old_path="/torchbox", redirect_link="http://aaargh.com/"
+                ),
+                models.Redirect(
+                    old_path="/unrelated", redirect_link="http://unrelated.com/"
+                ),
+            ]
         )
         response = self.get({"q": "Aaargh"})
-        self.assertEqual(len(response.context["redirects"]), 2)
+        self.assertEqual(response.context["paginator"].count, 2)
         self.assertEqual(response.context["query_string"], "Aaargh")
 
     def test_search_results(self):
-        models.Redirect.objects.create(
-            old_path="/aaargh", redirect_link="http://torchbox.com/"
-        )
-        models.Redirect.objects.create(
-            old_path="/torchbox", redirect_link="http://aaargh.com/"
-        )
-        models.Redirect.objects.create(
-            old_path="/unrelated", redirect_link="http://unrelated.com/"
+        models.Redirect.objects.bulk_create(
+            [
+                models.Redirect(
+                    old_path="/aaargh", redirect_link="http://torchbox.com/"
+                ),
+                models.Redirect(
+                    old_path="/torchbox", redirect_link="http://aaargh.com/"
+                ),
+                models.Redirect(
+                    old_path="/unrelated", redirect_link="http://unrelated.com/"
+                ),
+            ]
         )
         response = self.client.get(
             reverse("wagtailredirects:index_results"),
             {"q": "Aaargh"},
         )
-        self.assertEqual(len(response.context["redirects"]), 2)
+        self.assertEqual(response.context["paginator"].count, 2)
         self.assertEqual(response.context["query_string"], "Aaargh")
 
     def test_pagination(self):
@@ -659,13 +577,18 @@ class TestRedirectsIndexView(AdminTemplateTestUtils, WagtailTestUtils, TestCase)
             self.assertEqual(response.status_code, 200)
 
     def test_default_ordering(self):
-        for i in range(0, 10):
-            models.Redirect.objects.create(
-                old_path="/redirect%d" % i, redirect_link="http://torchbox.com/"
-            )
-
-        models.Redirect.objects.create(
-            old_path="/aaargh", redirect_link="http://torchbox.com/"
+        models.Redirect.objects.bulk_create(
+            [
+                models.Redirect(
+                    old_path="/redirect%d" % i, redirect_link="http://torchbox.com/"
+                )
+                for i in range(0, 10)
+            ]
+            + [
+                models.Redirect(
+                    old_path="/aaargh", redirect_link="http://torchbox.com/"
+                )
+            ]
         )
 
         response = self.get()
@@ -688,16 +611,17 @@ class TestRedirectsIndexView(AdminTemplateTestUtils, WagtailTestUtils, TestCase)
             with self.subTest(ordering=ordering):
                 response = self.get({"ordering": ordering})
                 self.assertEqual(response.status_code, 200)
-                soup = self.get_soup(response.content)
                 links = {
-                    reverse("wagtailredirects:index") + "?ordering=" + other
+                    self.index_url + "?ordering=" + other
                     for other in valid_orderings
                     if not other.startswith("-")
                     and other != ordering
                     or other == f"-{ordering}"
                 }
+                # A plain substring check is enough to find the sort links,
+                # without parsing the whole admin page for each ordering
                 for link in links:
-                    self.assertIsNotNone(soup.find("a", {"href": link}))
+                    self.assertContains(response, f'href="{link}"')
                 self.assertEqual(
                     response.context["object_list"].query.order_by,
                     (ordering,),
@@ -726,9 +650,9 @@ class TestRedirectsIndexView(AdminTemplateTestUtils, WagtailTestUtils, TestCase)
     def test_csv_export(self):
         models.Redirect.add_redirect("/from", "/to", False)
 
-        # Session, User, UserProfile, Redirects
-        with self.assertNumQueries(4):
-            response = self.get(params={"export": "csv"})
+        # Redirects
+        with self.assertNumQueries(1):
+            response = self.get_export("csv")
 
             csv_data = response.getvalue().decode().split("\n")
 
@@ -744,15 +668,29 @@ class TestRedirectsIndexView(AdminTemplateTestUtils, WagtailTestUtils, TestCase)
     def test_xlsx_export(self):
         models.Redirect.add_redirect("/from", "/to", True)
 
-        # Session, User, UserProfile, Redirects
-        with self.assertNumQueries(4):
-            response = self.get(params={"export": "xlsx"})
+        # Redirects
+        with self.assertNumQueries(1):
+            response = self.get_export("xlsx")
             workbook_data = response.getvalue()
 
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["Content-Type"],
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
 
-        worksheet = load_workbook(filename=BytesIO(workbook_data))["Sheet1"]
-        cell_array = [[cell.value for cell in row] for row in worksheet.rows]
+        workbook = load_workbook(
+            filename=BytesIO(workbook_data), read_only=True, data_only=True
+        )
+        worksheet = workbook["Sheet1"]
+        # Reading one row past the expected data is enough to check that there are
+        # no extra rows. Read-only worksheets skip trailing empty cells unless the
+        # width is given.
+        cell_array = [
+            list(row)
+            for row in worksheet.iter_rows(max_row=3, max_col=4, values_only=True)
+        ]
+        workbook.close()
 
         self.assertEqual(cell_array[0], ["From", "To", "Type", "Site"])
         self.assertEqual(len(cell_array), 2)
@@ -760,13 +698,39 @@ class TestRedirectsIndexView(AdminTemplateTestUtils, WagtailTestUtils, TestCase)
 
     def test_num_queries_in_export(self):
         page = Page.objects.get(id=2)
-        for i in range(3):
-            models.Redirect.add_redirect(f"/from{i}", "/to", False)
-            models.Redirect.add_redirect(f"/from-site{i}", "/to", False, site=self.site)
-            models.Redirect.add_redirect(f"/to-page{i}", page, False)
+        models.Redirect.objects.bulk_create(
+            [
+                models.Redirect(
+                    old_path=f"/from{i}", redirect_link="/to", is_permanent=False
+                )
+                for i in range(3)
+            ]
+        )
+        models.Redirect.objects.bulk_create(
+            [
+                models.Redirect(
+                    old_path=f"/from-site{i}",
+                    redirect_link="/to",
+                    is_permanent=False,
+                    site=self.site,
+                )
+                for i in range(3)
+            ]
+        )
+        models.Redirect.objects.bulk_create(
+            [
+                models.Redirect(
+                    old_path=f"/to-page{i}", redirect_page=page, is_permanent=False
+                )
+                for i in range(3)
+            ]
+        )
+
+        # Warm up the site root paths cache used to resolve page redirect targets,
+        # so that only the per-request queries are counted below. The export is
+        # streamed, so the content must be consumed for the queries to run.
+        self.get(params={"export": "csv"}).getvalue()
 
-        response = self.get(params={"export": "csv"})
-        csv_data = response.getvalue().decode().strip().split("\n")
         # Session, User, UserProfile, Redirects
         with self.assertNumQueries(4):
             response = self.get(params={"export": "csv"})
@@ -782,18 +746,33 @@ class TestRedirectsIndexView(AdminTemplateTestUtils, WagtailTestUtils, TestCase)
         },
     },
 )
-class TestRedirectsAddView(WagtailTestUtils, TestCase):
-    fixtures = ["test.json"]
+class TestRedirectsAddView(RedirectAssertionsMixin, WagtailTestUtils, TestCase):
+    BASE_POST = {
+        "old_path": "/test",
+        "site": "",
+        "is_permanent": "on",
+        "redirect_link": "http://www.test.com/",
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.localhost = Site.objects.get(hostname="localhost")
+        cls.user = cls.create_test_user()
+        cls.index_url = reverse("wagtailredirects:index")
+        cls.add_url = reverse("wagtailredirects:add")
+        cls.contact_page = cls.localhost.root_page.add_child(
+            instance=Page(title="Contact us", slug="contact-us", live=True)
+        )
 
     def setUp(self):
-        self.login()
+        self.client.force_login(self.user)
         PURGED_URLS.clear()
 
-    def get(self, params={}):
-        return self.client.get(reverse("wagtailredirects:add"), params)
+    def get(self, params=None):
+        return self.client.get(self.add_url, params)
 
-    def post(self, post_data={}):
-        return self.client.post(reverse("wagtailredirects:add"), post_data)
+    def post(self, post_data=None):
+        return self.client.post(self.add_url, post_data)
 
     def test_simple(self):
         response = self.get()
@@ -802,64 +781,49 @@ class TestRedirectsAddView(WagtailTestUtils, TestCase):
 
     def test_add(self):
         with self.captureOnCommitCallbacks(execute=True):
-            response = self.post(
-                {
-                    "old_path": "/test",
-                    "site": "",
-                    "is_permanent": "on",
-                    "redirect_link": "http://www.test.com/",
-                }
-            )
+            response = self.post(self.BASE_POST)
 
         # Should redirect back to index
-        self.assertRedirects(response, reverse("wagtailredirects:index"))
+        self.assertTemporaryRedirect(response, self.index_url)
 
         # Check that the redirect was created
-        redirects = models.Redirect.objects.filter(old_path="/test")
-        redirect = redirects.first()
-        self.assertEqual(redirects.count(), 1)
+        redirects = list(models.Redirect.objects.filter(old_path="/test"))
+        self.assertEqual(len(redirects), 1)
+        redirect = redirects[0]
         self.assertEqual(redirect.redirect_link, "http://www.test.com/")
         self.assertIsNone(redirect.site)
 
         # Check that the action log is marked as "created"
-        log_entry = log_registry.get_logs_for_instance(redirect).first()
-        self.assertEqual(log_entry.action, "wagtail.create")
+        log_action = (
+            log_registry.get_logs_for_instance(redirect)
+            .values_list("action", flat=True)
+            .first()
+        )
+        self.assertEqual(log_action, "wagtail.create")
 
         self.assertEqual(PURGED_URLS, {"http://localhost/test"})
 
     def test_add_with_site(self):
         with self.captureOnCommitCallbacks(execute=True):
-            localhost = Site.objects.get(hostname="localhost")
-            response = self.post(
-                {
-                    "old_path": "/test",
-                    "site": localhost.id,
-                    "is_permanent": "on",
-                    "redirect_link": "http://www.test.com/",
-                }
-            )
+            response = self.post({**self.BASE_POST, "site": self.localhost.id})
 
         # Should redirect back to index
-        self.assertRedirects(response, reverse("wagtailredirects:index"))
+        self.assertTemporaryRedirect(response, self.index_url)
 
         # Check that the redirect was created
-        redirects = models.Redirect.objects.filter(old_path="/test")
-        self.assertEqual(redirects.count(), 1)
-        self.assertEqual(redirects.first().redirect_link, "http://www.test.com/")
-        self.assertEqual(redirects.first().site, localhost)
+        redirects = list(
+            models.Redirect.objects.select_related("site").filter(old_path="/test")
+        )
+        self.assertEqual(len(redirects), 1)
+        redirect = redirects[0]
+        self.assertEqual(redirect.redirect_link, "http://www.test.com/")
+        self.assertEqual(redirect.site, self.localhost)
 
         self.assertEqual(PURGED_URLS, {"http://localhost/test"})
 
     def test_add_validation_error(self):
         with self.captureOnCommitCallbacks(execute=True):
-            response = self.post(
-                {
-                    "old_path": "",
-                    "site": "",
-                    "is_permanent": "on",
-                    "redirect_link": "http://www.test.com/",
-                }
-            )
+            response = self.post({**self.BASE_POST, "old_path": ""})
 
         # Should not redirect to index
         self.assertEqual(response.status_code, 200)
@@ -870,14 +834,7 @@ class TestRedirectsAddView(WagtailTestUtils, TestCase):
             models.Redirect.objects.create(
                 old_path="/test", site=None, redirect_link="http://elsewhere.com/"
             )
-            response = self.post(
-                {
-                    "old_path": "/test",
-                    "site": "",
-                    "is_permanent": "on",
-                    "redirect_link": "http://www.test.com/",
-                }
-            )
+            response = self.post(self.BASE_POST)
 
         # Should not redirect to index
         self.assertEqual(response.status_code, 200)
@@ -885,76 +842,65 @@ class TestRedirectsAddView(WagtailTestUtils, TestCase):
 
     def test_cannot_add_duplicate_on_same_site(self):
         with self.captureOnCommitCallbacks(execute=True):
-            localhost = Site.objects.get(hostname="localhost")
             models.Redirect.objects.create(
-                old_path="/test", site=localhost, redirect_link="http://elsewhere.com/"
-            )
-            response = self.post(
-                {
-                    "old_path": "/test",
-                    "site": localhost.pk,
-                    "is_permanent": "on",
-                    "redirect_link": "http://www.test.com/",
-                }
+                old_path="/test",
+                site=self.localhost,
+                redirect_link="http://elsewhere.com/",
             )
+            response = self.post({**self.BASE_POST, "site": self.localhost.pk})
 
         # Should not redirect to index
         self.assertEqual(response.status_code, 200)
         self.assertEqual(PURGED_URLS, set())
 
     def test_can_reuse_path_on_other_site(self):
-        with self.captureOnCommitCallbacks(execute=True):
-            localhost = Site.objects.get(hostname="localhost")
-            contact_page = Page.objects.get(url_path="/home/contact-us/")
-            other_site = Site.objects.create(
-                hostname="other.example.com", port=80, root_page=contact_page
-            )
+        # Created here rather than in setUpTestData, as redirects without a site
+        # purge their path on every site in the other tests
+        other_site = Site.objects.create(
+            hostname="other.example.com", port=80, root_page=self.contact_page
+        )
 
+        with self.captureOnCommitCallbacks(execute=True):
             models.Redirect.objects.create(
-                old_path="/test", site=localhost, redirect_link="http://elsewhere.com/"
-            )
-            response = self.post(
-                {
-                    "old_path": "/test",
-                    "site": other_site.pk,
-                    "is_permanent": "on",
-                    "redirect_link": "http://www.test.com/",
-                }
+                old_path="/test",
+                site=self.localhost,
+                redirect_link="http://elsewhere.com/",
             )
+            response = self.post({**self.BASE_POST, "site": other_site.pk})
 
         # Should redirect back to index
-        self.assertRedirects(response, reverse("wagtailredirects:index"))
+        self.assertTemporaryRedirect(response, self.index_url)
 
         # Check that the redirect was created
-        redirects = models.Redirect.objects.filter(redirect_link="http://www.test.com/")
-        self.assertEqual(redirects.count(), 1)
+        redirect = models.Redirect.objects.select_related("site").get(
+            redirect_link="http://www.test.com/"
+        )
 
-        self.assertEqual(PURGED_URLS, redirects.get().old_links())
+        self.assertEqual(PURGED_URLS, redirect.old_links())
 
     def test_add_long_redirect(self):
         with self.captureOnCommitCallbacks(execute=True):
             response = self.post(
                 {
-                    "old_path": "/test",
-                    "site": "",
-                    "is_permanent": "on",
+                    **self.BASE_POST,
                     "redirect_link": "https://www.google.com/search?q=this+is+a+very+long+url+because+it+has+a+huge+search+term+appended+to+the+end+of+it+even+though+someone+should+really+not+be+doing+something+so+crazy+without+first+seeing+a+psychiatrist",
                 }
             )
 
         # Should redirect back to index
-        self.assertRedirects(response, reverse("wagtailredirects:index"))
+        self.assertTemporaryRedirect(response, self.index_url)
 
         # Check that the redirect was created
-        redirects = models.Redirect.objects.filter(old_path="/test")
-        self.assertEqual(redirects.count(), 1)
+        redirects = list(models.Redirect.objects.filter(old_path="/test"))
+        self.assertEqual(len(redirects), 1)
+        redirect = redirects[0]
         self.assertEqual(
-            redirects.first().redirect_link,
+            redirect.redirect_link,
             "https://www.google.com/search?q=this+is+a+very+long+url+because+it+has+a+huge+search+term+appended+to+the+end+of+it+even+though+someone+should+really+not+be+doing+something+so+crazy+without+first+seeing+a+psychiatrist",
         )
-        self.assertIsNone(redirects.first().site)
+        self.assertIsNone(redirect.site)
 
-        self.assertEqual(PURGED_URLS, redirects.get().old_links())
+        self.assertEqual(PURGED_URLS, redirect.old_links())
 
 
 @override_settings(
@@ -964,30 +910,46 @@ class TestRedirectsAddView(WagtailTestUtils, TestCase):
         },
     },
 )
-class TestRedirectsEditView(AdminTemplateTestUtils, WagtailTestUtils, TestCase):
-    def setUp(self):
-        # Create a redirect to edit
-        self.redirect = models.Redirect(
+class TestRedirectsEditView(
+    RedirectAssertionsMixin, AdminTemplateTestUtils, WagtailTestUtils, TestCase
+):
+    BASE_POST = {
+        "old_path": "/test",
+        "is_permanent": "on",
+        "site": "",
+        "redirect_link": "http://www.test.com/ive-been-edited",
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        # Create a redirect to edit, and another one whose path it can't take
+        cls.redirect = models.Redirect.objects.create(
             old_path="/test", redirect_link="http://www.test.com/"
         )
-        self.redirect.save()
+        models.Redirect.objects.create(
+            old_path="/othertest", redirect_link="http://elsewhere.com/"
+        )
+        cls.localhost = Site.objects.get(hostname="localhost")
+        cls.user = cls.create_test_user()
+        cls.index_url = reverse("wagtailredirects:index")
+        cls.edit_url = reverse("wagtailredirects:edit", args=(cls.redirect.id,))
 
+    def setUp(self):
         # Login
-        self.user = self.login()
+        self.client.force_login(self.user)
 
         PURGED_URLS.clear()
 
-    def get(self, params={}, redirect_id=None):
-        return self.client.get(
-            reverse("wagtailredirects:edit", args=(redirect_id or self.redirect.id,)),
-            params,
-        )
+    def get_url(self, redirect_id=None):
+        if redirect_id is None:
+            return self.edit_url
+        return reverse("wagtailredirects:edit", args=(redirect_id,))
 
-    def post(self, post_data={}, redirect_id=None):
-        return self.client.post(
-            reverse("wagtailredirects:edit", args=(redirect_id or self.redirect.id,)),
-            post_data,
-        )
+    def get(self, params=None, redirect_id=None):
+        return self.client.get(self.get_url(redirect_id), params)
+
+    def post(self, post_data=None, redirect_id=None):
+        return self.client.post(self.get_url(redirect_id), post_data)
 
     def test_simple(self):
         response = self.get()
@@ -995,7 +957,7 @@ class TestRedirectsEditView(AdminTemplateTestUtils, WagtailTestUtils, TestCase):
         self.assertTemplateUsed(response, "wagtailredirects/edit.html")
         self.assertBreadcrumbsItemsRendered(
             [
-                {"url": reverse("wagtailredirects:index"), "label": "Redirects"},
+                {"url": self.index_url, "label": "Redirects"},
                 {"url": "", "label": "/test"},
             ],
             response.content,
@@ -1010,63 +972,40 @@ class TestRedirectsEditView(AdminTemplateTestUtils, WagtailTestUtils, TestCase):
 
     def test_edit(self):
         with self.captureOnCommitCallbacks(execute=True):
-            response = self.post(
-                {
-                    "old_path": "/test",
-                    "is_permanent": "on",
-                    "site": "",
-                    "redirect_link": "http://www.test.com/ive-been-edited",
-                }
-            )
+            response = self.post(self.BASE_POST)
 
         # Should redirect back to index
-        self.assertRedirects(response, reverse("wagtailredirects:index"))
+        self.assertTemporaryRedirect(response, self.index_url)
 
         # Check that the redirect was edited
-        redirects = models.Redirect.objects.filter(old_path="/test")
-        self.assertEqual(redirects.count(), 1)
-        self.assertEqual(
-            redirects.first().redirect_link, "http://www.test.com/ive-been-edited"
-        )
-        self.assertIsNone(redirects.first().site)
+        redirects = list(models.Redirect.objects.filter(old_path="/test"))
+        self.assertEqual(len(redirects), 1)
+        redirect = redirects[0]
+        self.assertEqual(redirect.redirect_link, "http://www.test.com/ive-been-edited")
+        self.assertIsNone(redirect.site)
 
         self.assertEqual(PURGED_URLS, {"http://localhost/test"})
 
     def test_edit_with_site(self):
         with self.captureOnCommitCallbacks(execute=True):
-            localhost = Site.objects.get(hostname="localhost")
-
-            response = self.post(
-                {
-                    "old_path": "/test",
-                    "is_permanent": "on",
-                    "site": localhost.id,
-                    "redirect_link": "http://www.test.com/ive-been-edited",
-                }
-            )
+            response = self.post({**self.BASE_POST, "site": self.localhost.id})
 
         # Should redirect back to index
-        self.assertRedirects(response, reverse("wagtailredirects:index"))
+        self.assertTemporaryRedirect(response, self.index_url)
 
         # Check that the redirect was edited
-        redirects = models.Redirect.objects.filter(old_path="/test")
-        self.assertEqual(redirects.count(), 1)
-        self.assertEqual(
-            redirects.first().redirect_link, "http://www.test.com/ive-been-edited"
+        redirects = list(
+            models.Redirect.objects.select_related("site").filter(old_path="/test")
         )
-        self.assertEqual(redirects.first().site, localhost)
+        self.assertEqual(len(redirects), 1)
+        redirect = redirects[0]
+        self.assertEqual(redirect.redirect_link, "http://www.test.com/ive-been-edited")
+        self.assertEqual(redirect.site, self.localhost)
         self.assertEqual(PURGED_URLS, {"http://localhost/test"})
 
     def test_edit_validation_error(self):
         with self.captureOnCommitCallbacks(execute=True):
-            response = self.post(
-                {
-                    "old_path": "",
-                    "is_permanent": "on",
-                    "site": "",
-                    "redirect_link": "http://www.test.com/ive-been-edited",
-                }
-            )
+            response = self.post({**self.BASE_POST, "old_path": ""})
 
         # Should not redirect to index
         self.assertEqual(response.status_code, 200)
@@ -1074,17 +1013,7 @@ class TestRedirectsEditView(AdminTemplateTestUtils, WagtailTestUtils, TestCase):
 
     def test_edit_duplicate(self):
         with self.captureOnCommitCallbacks(execute=True):
-            models.Redirect.objects.create(
-                old_path="/othertest", site=None, redirect_link="http://elsewhere.com/"
-            )
-            response = self.post(
-                {
-                    "old_path": "/othertest",
-                    "is_permanent": "on",
-                    "site": "",
-                    "redirect_link": "http://www.test.com/ive-been-edited",
-                }
-            )
+            response = self.post({**self.BASE_POST, "old_path": "/othertest"})
 
         # Should not redirect to index
         self.assertEqual(response.status_code, 200)
@@ -1131,29 +1060,33 @@ class TestRedirectsEditView(AdminTemplateTestUtils, WagtailTestUtils, TestCase):
         },
     },
 )
-class TestRedirectsDeleteView(WagtailTestUtils, TestCase):
-    def setUp(self):
+class TestRedirectsDeleteView(RedirectAssertionsMixin, WagtailTestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls):
         # Create a redirect to edit
-        self.redirect = models.Redirect(
+        cls.redirect = models.Redirect.objects.create(
             old_path="/test", redirect_link="http://www.test.com/"
         )
-        self.redirect.save()
+        cls.user = cls.create_test_user()
+        cls.index_url = reverse("wagtailredirects:index")
+        cls.delete_url = reverse("wagtailredirects:delete", args=(cls.redirect.id,))
 
+    def setUp(self):
         # Login
-        self.login()
+        self.client.force_login(self.user)
 
         PURGED_URLS.clear()
 
-    def get(self, params={}, redirect_id=None):
-        return self.client.get(
-            reverse("wagtailredirects:delete", args=(redirect_id or self.redirect.id,)),
-            params,
-        )
+    def get_url(self, redirect_id=None):
+        if redirect_id is None:
+            return self.delete_url
+        return reverse("wagtailredirects:delete", args=(redirect_id,))
+
+    def get(self, params=None, redirect_id=None):
+        return self.client.get(self.get_url(redirect_id), params)
 
     def post(self, redirect_id=None):
-        return self.client.post(
-            reverse("wagtailredirects:delete", args=(redirect_id or self.redirect.id,))
-        )
+        return self.client.post(self.get_url(redirect_id))
 
     def test_simple(self):
         response = self.get()
@@ -1168,7 +1101,7 @@ class TestRedirectsDeleteView(WagtailTestUtils, TestCase):
             response = self.post()
 
         # Should redirect back to index
-        self.assertRedirects(response, reverse("wagtailredirects:index"))
+        self.assertTemporaryRedirect(response, self.index_url)
 
         # Check that the redirect was deleted
         redirects = models.Redirect.objects.filter(old_path="/test")